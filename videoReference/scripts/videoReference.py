@@ -1,18 +1,17 @@
-# Third-Party imports
-try:
-	import cv2
-except ImportError:
-	raise RuntimeError("opencv-python module could not be imported, is it installed?")
-
 # Built-in imports
+import os
+import json
+import shutil
 import logging
+import subprocess as sp
+from fractions import Fraction
+from contextlib import suppress, contextmanager
+import concurrent.futures
 from typing import Tuple
 
 # Third-party imports
 from maya import cmds
 from maya import mel
-import maya.OpenMaya as om
-import maya.OpenMayaUI as omui
 
 
 
@@ -24,23 +23,50 @@ class VideoReference():
 
 	"""Python module class for importing video references for animation."""
 
-	videoFilters = """
-		All Supported Video Formats ( .mp4 .mov .avi ) (*.mp4 *.mov *.avi);;
-		Youtube and Vimeo ( .mp4 ) (*.mp4);;
-		QuickTime ( .mov ) (*.mov);;
-		Audio Video Interleave ( .avi ) (*.avi)
-	"""
+	videoFilters = (
+		"All Supported Video Formats ( .mp4 .mov .avi ) (*.mp4 *.mov *.avi);;"
+		"Youtube and Vimeo ( .mp4 ) (*.mp4);;"
+		"QuickTime ( .mov ) (*.mov);;"
+		"Audio Video Interleave ( .avi ) (*.avi)"
+	)
 	_cameraTransform = None
 	_nearClip = None
 	_timeEditorComposition = None
-	_dgMod = om.MDGModifier()
+	_dgMod = None
+	# Video probing
+	_ffprobe = shutil.which("ffprobe")
+	# Seconds before giving up on ffprobe, e.g. when the video is on an unresponsive network share
+	_ffprobeTimeout = 60
+	_videoInfoCache = {}
 
 	# GUI
 	_menuItems = []
+	_optionBoxButtons = None
 	# Widgets
 	_attachToCameraWidget = 'videoReferenceAttachToCamera'
 	_animClipWidget = 'videoReferenceAnimClip'
 	_openTimeEditorWidget = 'videoReferenceOpenTimeEditor'
+	# Option box widgets, the doIt argument each of them controls and their labels
+	_optionWidgets = (
+		(_attachToCameraWidget, 'attachToCamera', 'Attach To Camera'),
+		(_animClipWidget, 'animClip', 'Create Time Editor Clip'),
+		(_openTimeEditorWidget, 'openTimeEditor', 'Open Time Editor'),
+	)
+
+	@classmethod
+	def getDGModifier(cls) -> "om.MDGModifier":
+		"""Returns the DGModifier shared by all operations, it is created on first use.
+
+		Returns:
+			MDGModifier: The shared DGModifier
+
+		"""
+		import maya.OpenMaya as om
+
+		if cls._dgMod is None: cls._dgMod = om.MDGModifier()
+
+		return cls._dgMod
+
 
 	@classmethod
 	def unhideCamera(cls, visibilityPlug) -> bool:
@@ -86,14 +112,14 @@ class VideoReference():
 				)
 				if input == "Break":
 					sourcePlug = visibilityPlug.source()
-					cls._dgMod.disconnect(sourcePlug, visibilityPlug)
+					cls.getDGModifier().disconnect(sourcePlug, visibilityPlug)
 					logger.debug(f"Incoming connection was broken!")
 				else:
 					logger.debug("Incoming connection was not broken and video planes were still created.")
 
 			visibilityPlug.setBool(True)
 
-			cls._dgMod.doIt()
+			cls.getDGModifier().doIt()
 
 			return True
 
@@ -108,6 +134,9 @@ class VideoReference():
 		target camera is visible.
 
 		"""
+		import maya.OpenMaya as om
+		import maya.OpenMayaUI as omui
+
 		cameraPath = om.MDagPath()
 		omui.M3dView.active3dView().getCamera(cameraPath)
 		cameraTransformFn = om.MFnDependencyNode(cameraPath.transform())
@@ -133,6 +162,144 @@ class VideoReference():
 		cls._timeEditorComposition = cmds.timeEditorComposition(query=True, active=True)
 
 
+	@classmethod
+	def readVideoStream(cls, path, entries, countPackets=False) -> dict or None:
+		"""Reads the given entries of the first video stream with ffprobe.
+
+		Args:
+			path (str): Path to the video file
+			entries (str): Comma separated stream entries to read e.g. "width,height"
+			countPackets (bool): If True ffprobe demuxes the whole file to count the packets
+
+		Returns:
+			stream (dict or None): The requested entries, None if ffprobe could not read them.
+
+		"""
+		command = [
+			cls._ffprobe, "-v", "error", "-select_streams", "v:0",
+			"-show_entries", f"stream={entries}", "-of", "json", path
+		]
+		if countPackets: command.insert(1, "-count_packets")
+
+		try:
+			result = sp.run(
+				command, capture_output=True, text=True, timeout=cls._ffprobeTimeout,
+				creationflags=getattr(sp, "CREATE_NO_WINDOW", 0)
+			)
+		except (OSError, sp.TimeoutExpired):
+			return None
+		if result.returncode != 0: return None
+
+		try:
+			return json.loads(result.stdout)["streams"][0]
+		except (ValueError, KeyError, IndexError):
+			return None
+
+
+	@classmethod
+	def probeVideoWithFFprobe(cls, path) -> Tuple[int, int, int] or None:
+		"""Reads the video dimensions and number of frames from the container metadata.
+
+		The number of frames is taken from the nb_frames header when the container stores it,
+		otherwise it is computed from the stream duration and frame rate as exact fractions. Only
+		if both are missing the video packets are counted, which reads the whole file but still
+		does not decode it, the same approach recommended in place of CAP_PROP_FRAME_COUNT.
+
+		Args:
+			path (str): Path to the video file
+
+		Returns:
+			videoInfo (Tuple[int, int, int] or None): Width, height and number of frames of the video,
+				None if ffprobe could not read them.
+
+		"""
+		stream = cls.readVideoStream(path, "width,height,nb_frames,duration,r_frame_rate")
+		if not stream: return None
+
+		try:
+			width = int(stream["width"])
+			height = int(stream["height"])
+			if stream.get("nb_frames", "N/A") != "N/A":
+				duration = int(stream["nb_frames"])
+			elif stream.get("duration", "N/A") != "N/A":
+				duration = int(Fraction(stream["duration"]) * Fraction(stream["r_frame_rate"]))
+			else:
+				packets = cls.readVideoStream(path, "nb_read_packets", countPackets=True)
+				duration = int(packets["nb_read_packets"])
+		except (ValueError, KeyError, TypeError, ZeroDivisionError):
+			return None
+
+		return width, height, duration
+
+
+	@staticmethod
+	@contextmanager
+	def openVideoCapture(path):
+		"""Opens the video with opencv and releases the capture when leaving the context.
+
+		Args:
+			path (str): Path to the video file
+
+		Yields:
+			cap (cv2.VideoCapture): Opened video capture
+
+		"""
+		import cv2
+
+		cap = cv2.VideoCapture(path)
+		try:
+			yield cap
+		finally:
+			cap.release()
+
+
+	@staticmethod
+	def probeVideoWithOpenCV(path) -> Tuple[int, int, int]:
+		"""Reads the video dimensions and number of frames by opening the video with opencv.
+
+		Args:
+			path (str): Path to the video file
+
+		Returns:
+			videoInfo (Tuple[int, int, int]): Width, height and number of frames of the video
+
+		"""
+		try:
+			import cv2
+		except ImportError:
+			raise RuntimeError("opencv-python module could not be imported, is it installed?")
+
+		with VideoReference.openVideoCapture(path) as cap:
+			width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+			height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+			duration = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+		return width, height, duration
+
+
+	@classmethod
+	def probeVideo(cls, path) -> Tuple[int, int, int]:
+		"""Reads the video dimensions and number of frames of the given video file.
+
+		ffprobe is preferred because it reads the values from the container metadata without
+		initializing a decoder, opencv is used if ffprobe is not installed or fails. The results
+		are cached per path and modification time, so importing the same video again is free.
+
+		Args:
+			path (str): Path to the video file
+
+		Returns:
+			videoInfo (Tuple[int, int, int]): Width, height and number of frames of the video
+
+		"""
+		key = (path, os.stat(path).st_mtime_ns)
+		if key not in cls._videoInfoCache:
+			videoInfo = cls.probeVideoWithFFprobe(path) if cls._ffprobe else None
+			cls._videoInfoCache[key] = videoInfo or cls.probeVideoWithOpenCV(path)
+
+		return cls._videoInfoCache[key]
+
+
 	@classmethod
 	def createVideoPlane(cls, name, path, width, height, duration) -> Tuple[str, str]:
 		"""Creates and sets up the image plane to work with video files.
@@ -149,17 +316,15 @@ class VideoReference():
 			videoShape (str): String representation of the video shape node
 
 		"""
-		cmds.imagePlane(
+		videoTransform, videoShape = cmds.imagePlane(
 			name=name,
 			lookThrough="persp",
 			maintainRatio=True,
 			width=width * 0.1,
 			height=height * 0.1,
 		)
-		videoTransform = cmds.ls(selection=True)[0]
-		videoShape = cmds.rename(
-			cmds.listRelatives(videoTransform, allDescendents=True), f"{videoTransform}Shape"
-		)
+		if videoShape != f"{videoTransform}Shape":
+			videoShape = cmds.rename(videoShape, f"{videoTransform}Shape")
 
 		cmds.setAttr(f"{videoShape}.type", 2)
 		cmds.setAttr(f"{videoShape}.textureFilter", 1)
@@ -220,13 +385,12 @@ class VideoReference():
 			scale (float): Size of the video plane
 
 		"""
-		cmds.parent(videoTransform, cls._cameraTransform)
+		videoTransform = cmds.parent(videoTransform, cls._cameraTransform)[0]
 
-		for attr in ["tx", "ty", "tz", "rx", "ry", "rz"]:
-			cmds.setAttr(f"{videoTransform}.{attr}", 0)
-		cmds.move(0, 0, -(cls._nearClip+1), videoTransform, os=True, r=True)
-
-		cmds.scale(scale, scale, scale)
+		# Place the plane just beyond the near clip plane, facing the camera
+		cmds.setAttr(f"{videoTransform}.translate", 0, 0, -(cls._nearClip+1), type="double3")
+		cmds.setAttr(f"{videoTransform}.rotate", 0, 0, 0, type="double3")
+		cmds.setAttr(f"{videoTransform}.scale", scale, scale, scale, type="double3")
 
 
 	@classmethod
@@ -248,6 +412,11 @@ class VideoReference():
 		videoPaths = cmds.fileDialog2(fileMode=4, dialogStyle=2, fileFilter=cls.videoFilters)
 
 		if videoPaths:
+			# Probing only waits on the file system, so all videos are probed at once, the Maya
+			# commands below are not thread-safe and stay on the main thread
+			with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(videoPaths))) as executor:
+				videoInfos = list(executor.map(cls.probeVideo, videoPaths))
+
 			cls.setupCamera()
 
 			currentFrame = cmds.currentTime(query=True)
@@ -257,12 +426,8 @@ class VideoReference():
 				if openTimeEditor:
 					cmds.TimeEditorWindow()
 
-			for path in videoPaths:
-				cap = cv2.VideoCapture(path)
-				video = path.split("/")[-1].split(".")[0]
-				width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-				height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-				duration = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+			for path, (width, height, duration) in zip(videoPaths, videoInfos):
+				video = os.path.splitext(os.path.basename(path))[0]
 
 				videoTransform, videoShape = cls.createVideoPlane(video, path, width, height, duration)
 
@@ -308,58 +473,32 @@ class VideoReference():
 		mel.eval('setOptionBoxTitle("Video Reference Options")')
 		mel.eval('setOptionBoxCommandName("videoReference")')
 
-		for widget in [cls._attachToCameraWidget, cls._animClipWidget, cls._openTimeEditorWidget]:
-			try: cmds.deletUI(widget, control=True)
-			except:	pass
-
-		# Attach to Camera
-		attachToCamera = cmds.optionVar(query=cls._attachToCameraWidget)
-		cmds.checkBoxGrp(
-			cls._attachToCameraWidget,
-			label='Attach To Camera',
-			numberOfCheckBoxes=1,
-			value1=int(attachToCamera)
-		)
-
-		# Time Editor Clip
-		animClip = cmds.optionVar(query=cls._animClipWidget)
-		cmds.checkBoxGrp(
-			cls._animClipWidget,
-			label='Create Time Editor Clip',
-			numberOfCheckBoxes=1,
-			value1=int(animClip)
-		)
+		# Widgets left over from a previous time the option box was open
+		for widget, _, _ in cls._optionWidgets:
+			with suppress(RuntimeError): cmds.deleteUI(widget, control=True)
 
-		# Open Time Editor
-		openTimeEditor = cmds.optionVar(query=cls._openTimeEditorWidget)
-		cmds.checkBoxGrp(
-			cls._openTimeEditorWidget,
-			label='Open Time Editor',
-			numberOfCheckBoxes=1,
-			value1=int(openTimeEditor)
-		)
-
-		# Action Buttons
-		applyAndCloseButton = mel.eval('getOptionBoxApplyAndCloseBtn')
-		cmds.button(applyAndCloseButton, edit=True, command=cls.applyAndCloseButton)
-
-		applyButton = mel.eval('getOptionBoxApplyBtn')
-		cmds.button(applyButton, edit=True, command=cls.createVideoReference)
-
-		closeButton = mel.eval('getOptionBoxCloseBtn')
-		cmds.button(closeButton, edit=True, command=cls.closeOptionBox)
+		for widget, _, label in cls._optionWidgets:
+			cmds.checkBoxGrp(
+				widget,
+				label=label,
+				numberOfCheckBoxes=1,
+				value1=int(cmds.optionVar(query=widget))
+			)
 
-		# Buttons in the menu only accepts MEL
-		resetButton = mel.eval('getOptionBoxResetBtn')
-		cmds.button(resetButton, edit=True,
-		 	command='python("from videoReference import VideoReference; VideoReference.resetToDefaults()")'
+		# Action Buttons, the Reset and Save buttons in the menu only accept MEL
+		buttons = (
+			('ApplyAndClose', cls.applyAndCloseButton),
+			('Apply', cls.createVideoReference),
+			('Close', cls.closeOptionBox),
+			('Reset', 'python("from videoReference import VideoReference; VideoReference.resetToDefaults()")'),
+			('Save', 'python("from videoReference import VideoReference; VideoReference.getCreateCommandKwargs()")'),
 		)
+		# The button names only change if Maya rebuilds the option box window
+		if cls._optionBoxButtons is None or not cmds.control(cls._optionBoxButtons['Apply'], exists=True):
+			cls._optionBoxButtons = {button: mel.eval(f'getOptionBox{button}Btn') for button, _ in buttons}
 
-		# Buttons in the menu only accepts MEL
-		saveButton = mel.eval('getOptionBoxSaveBtn')
-		cmds.button(saveButton,	edit=True,
-		 	command='python("from videoReference import VideoReference; VideoReference.getCreateCommandKwargs()")'
-		)
+		for button, command in buttons:
+			cmds.button(cls._optionBoxButtons[button], edit=True, command=command)
 
 		mel.eval('showOptionBox')
 
@@ -392,50 +531,19 @@ class VideoReference():
 		"""
 		args = {}
 
-		# Attach to Camera
-		if cmds.checkBoxGrp(cls._attachToCameraWidget, exists=True):
-			if cmds.checkBoxGrp(cls._attachToCameraWidget, query=True, value1=True):
-				args['attachToCamera'] = True
-				cmds.optionVar(intValue=(cls._attachToCameraWidget, 1))
-			else:
-				args['attachToCamera'] = False
-				cmds.optionVar(intValue=(cls._attachToCameraWidget, 0))
-		else:
-			value = cmds.optionVar(query=cls._attachToCameraWidget)
-			if value:
-				args['attachToCamera'] = True
-
-		# Create Time Editor Clip
-		if cmds.checkBoxGrp(cls._animClipWidget, exists=True):
-			if cmds.checkBoxGrp(cls._animClipWidget, query=True, value1=True):
-				args['animClip'] = True
-				cmds.optionVar(intValue=(cls._animClipWidget, 1))
-			else:
-				args['animClip'] = False
-				cmds.optionVar(intValue=(cls._animClipWidget, 0))
-		else:
-			value = cmds.optionVar(query=cls._animClipWidget)
-			if value:
-				args['animClip'] = True
-
-		# Open Time Editor
-		if cmds.checkBoxGrp(cls._openTimeEditorWidget, exists=True):
-			if cmds.checkBoxGrp(cls._openTimeEditorWidget, query=True, value1=True):
-				args['openTimeEditor'] = True
-				cmds.optionVar(intValue=(cls._openTimeEditorWidget, 1))
-			else:
-				args['openTimeEditor'] = False
-				cmds.optionVar(intValue=(cls._openTimeEditorWidget, 0))
-		else:
-			value = cmds.optionVar(query=cls._openTimeEditorWidget)
-			if value:
-				args['openTimeEditor'] = True
+		for widget, argument, _ in cls._optionWidgets:
+			if cmds.checkBoxGrp(widget, exists=True):
+				value = cmds.checkBoxGrp(widget, query=True, value1=True)
+				args[argument] = bool(value)
+				cmds.optionVar(intValue=(widget, int(value)))
+			elif cmds.optionVar(query=widget):
+				args[argument] = True
 
 		return args
 
 
-	@classmethod
-	def closeOptionBox(cls, *args, **kwargs) -> None:
+	@staticmethod
+	def closeOptionBox(*args, **kwargs) -> None:
 		"""Closes the option box window."""
 		mel.eval('hideOptionBox')
 
@@ -451,11 +559,16 @@ class VideoReference():
 		"""
 		if len(cls._menuItems) == 0:
 			menu = "mainCreateMenu"
-			mel.eval("ModCreateMenu mainCreateMenu;")
 			items = cmds.menu(menu, query=True, itemArray=True)
-			measureItemIndex = None
-			for index, item in enumerate(items):
-				if item == "measureItem":	measureItemIndex = index
+			# The Create menu is only built the first time it is opened
+			if not items:
+				mel.eval("ModCreateMenu mainCreateMenu;")
+				items = cmds.menu(menu, query=True, itemArray=True)
+
+			try:
+				measureItemIndex = items.index("measureItem")
+			except ValueError:
+				measureItemIndex = len(items)
 
 			# Video Reference
 			videoReferenceItem = cmds.menuItem(
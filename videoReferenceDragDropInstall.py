@@ -1,15 +1,17 @@
 # Built-in imports
 import os
 import sys
+import importlib.metadata
 import logging
-import platform
+import stat
+import shutil
 import subprocess as sp
-from typing import List
+import zipfile
+import queue
+import concurrent.futures
 
 # Third-party imports
 from maya import cmds
-from maya.app.startup import basic
-from PySide2 import QtCore as qtc
 
 
 
@@ -31,32 +33,54 @@ class VideoReferenceInstaller():
 		"""Class constructor."""
 		# Main variables
 		self.moduleName = "videoReference"
-		self.dependencies = "opencv-python"
+		self.dependencies = ["opencv-python"]
+		# Wheels only, so pip never falls back to building opencv from source
+		self.pipFlags = ["--only-binary=:all:", "--disable-pip-version-check", "--no-input"]
 
-		# System
-		self.platformName = platform.platform()
+		# Environment
+		# Same separators as draggedFromPath, so the paths built from them are not mixed
+		self.mayaLocation = os.environ['MAYA_LOCATION'].replace("\\", "/")
+		self.mayaAppDir = os.environ['MAYA_APP_DIR'].replace("\\", "/")
+		self.mayaPythonVersion = int(os.environ['MAYA_PYTHON_VERSION'])
 
 		# Python
-		self.mayaPy = f"\"{os.environ['MAYA_LOCATION']}/bin/mayapy\""
+		self.mayaPy = f"{self.mayaLocation}/bin/mayapy{'.exe' if sys.platform == 'win32' else ''}"
 		self.mayaVersion = int(cmds.about(version=True))
 
 		# Paths
 		self.draggedFromPath = os.path.dirname(__file__).replace("\\", "/")  # In maya 2023 it returns "\\"
-		self.defaultModulesPath = f"{os.environ['MAYA_APP_DIR']}/modules"
-		self.defaultScriptsPath = f"{os.environ['MAYA_APP_DIR']}/scripts"
-		self.moduleScriptPath = f"{self.defaultModulesPath}/{self.moduleName}/scripts"
+		self.defaultModulesPath = f"{self.mayaAppDir}/modules"
+		self.defaultScriptsPath = f"{self.mayaAppDir}/scripts"
+		self.moduleSourcePath = f"{self.draggedFromPath}/{self.moduleName}"
+		self.moduleSourceScriptPath = f"{self.moduleSourcePath}/scripts"
+		# Optional bundle with the content of the moduleName folder, used instead of the folder
+		self.moduleArchivePath = f"{self.moduleSourcePath}.zip"
+		self.moduleDestinationPath = f"{self.defaultModulesPath}/{self.moduleName}"
+		self.moduleStagingPath = f"{self.defaultModulesPath}/.{self.moduleName}.tmp"
+		self.moduleScriptPath = f"{self.moduleDestinationPath}/scripts"
+		# Dependencies are installed in the staged module and moved in place together with it
+		self.dependenciesPath = f"{self.moduleStagingPath}/scripts/{self.mayaVersion}"
+		self.pipCachePath = f"{self.mayaAppDir}/.pip_cache/{self.moduleName}"
 
 		# Files
-		self.installationFiles = [
-			f"{self.draggedFromPath}/{self.moduleName}/scripts/{self.moduleName}.py",
-			f"{self.draggedFromPath}/{self.moduleName}/scripts/userSetup.py",
-			f"{self.draggedFromPath}/{self.moduleName}/icons/{self.moduleName}.png",
-			f"{self.draggedFromPath}/{self.moduleName}.mod"
-		]
-		self.existingFiles = [
-			f"{self.defaultModulesPath}/{self.moduleName}",
-			f"{self.defaultModulesPath}/{self.moduleName}.mod"
-		]
+		self.installationFiles = (
+			f"{self.moduleSourceScriptPath}/{self.moduleName}.py",
+			f"{self.moduleSourceScriptPath}/userSetup.py",
+			f"{self.moduleSourcePath}/icons/{self.moduleName}.png",
+			f"{self.moduleSourcePath}.mod"
+		)
+		self.existingFiles = (
+			self.moduleDestinationPath,
+			f"{self.moduleDestinationPath}.mod"
+		)
+		self.stagedFiles = (
+			self.moduleStagingPath,
+			f"{self.moduleDestinationPath}.mod.tmp"
+		)
+		self.backupFiles = (
+			f"{self.defaultModulesPath}/.{self.moduleName}.old",
+			f"{self.moduleDestinationPath}.mod.old"
+		)
 
 
 
@@ -75,11 +99,11 @@ class VideoReferenceInstaller():
 				otherwise True
 
 		"""
-		mayaPythonVersion = int(os.environ['MAYA_PYTHON_VERSION'])
-
-		logStr = f": Required python version is '{requiredVersion}' or higher, running '{mayaPythonVersion}'."
+		logStr = (
+			f": Required python version is '{requiredVersion}' or higher, running '{self.mayaPythonVersion}'."
+		)
 
-		if mayaPythonVersion >= requiredVersion:
+		if self.mayaPythonVersion >= requiredVersion:
 			logger.info(f"PASSED {logStr}")
 			return True
 
@@ -94,9 +118,24 @@ class VideoReferenceInstaller():
 			bool: True if the operation was successful, False if an	error occured during the operation.
 
 		"""
-		missingFiles = []
-		for file in self.installationFiles:
-			if not qtc.QFileInfo(file).exists(): missingFiles.append(file)
+		if zipfile.is_zipfile(self.moduleArchivePath):
+			# When the bundle is used, files of the moduleName folder must be in the bundle
+			with zipfile.ZipFile(self.moduleArchivePath) as archive:
+				corruptFile = archive.testzip()
+				archivedFiles = self.getArchivedFiles(archive)
+			if corruptFile is not None:
+				logger.critical(f"FAILED : Found corrupt file '{corruptFile}' in {self.moduleArchivePath}.")
+				return False
+			sourcePrefix = f"{self.moduleSourcePath}/"
+			missingFiles = []
+			for file in self.installationFiles:
+				if file.startswith(sourcePrefix):
+					found = file[len(sourcePrefix):] in archivedFiles
+				else:
+					found = os.path.exists(file)
+				if not found: missingFiles.append(file)
+		else:
+			missingFiles = [file for file in self.installationFiles if not os.path.exists(file)]
 
 		if len(missingFiles) == 0:
 			logger.info("PASSED : Find all installation files.")
@@ -148,62 +187,189 @@ class VideoReferenceInstaller():
 		return True
 
 
-	def removeExistingVersion(self) -> bool:
-		"""Removes all files from existing installation.
+	def removeFiles(self, paths) -> bool:
+		"""Removes the specified files and directories if they exist.
 
-		If files from existing installation have been found, they will be removed.
+		Each entry is checked with a single lstat, directories are removed with all their content.
+
+		Args:
+			paths (list): Paths to the files and directories to be removed.
+
+		Returns:
+			bool: True if the operation was successful, False if an	error occured during the operation.
 
 		"""
-		for path in self.existingFiles:
-			fileInfo = qtc.QFileInfo(path)
-			if fileInfo.exists():
-				if fileInfo.isDir(): qtc.QDir(path).removeRecursively()
-				if fileInfo.isFile(): qtc.QFile(path).remove()
+		def removeReadOnly(function, path, excInfo):
+			# Same as QDir.removeRecursively, make read-only files writable and try again
+			os.chmod(path, stat.S_IWRITE)
+			function(path)
 
-		logger.info("PASSED : Remove existing installation files if they exist.")
+		try:
+			for path in paths:
+				try:
+					mode = os.lstat(path).st_mode
+				except FileNotFoundError:
+					continue
+
+				if stat.S_ISDIR(mode):
+					shutil.rmtree(path, onerror=removeReadOnly)
+				else:
+					os.remove(path)
+		except OSError as error:
+			logger.warning(f"Files could not be removed: {error}")
+			return False
 
+		return True
 
-	def validateFileInfo(self, path) -> qtc.QFileInfo or False:
-		"""Validate the specified file.
 
-		Args:
-			path (str): Path to the object.
+	def replaceExistingVersion(self) -> bool:
+		"""Replaces the existing installation with the staged one.
+
+		The existing module folder and .mod file are first renamed to a backup, then the staged ones
+		are renamed in place with os.replace and only then the backup is removed. If any rename fails
+		the backup is renamed back, so the existing installation is never left half deleted.
 
 		Returns:
-			fileInfo (QFileInfo): If the specified object exists it will be returned,	if it does not
-			exist False will be returned instead.
+			bool: True if the operation was successful, False if an	error occured during the operation.
 
 		"""
-		fileInfo = qtc.QFileInfo(path)
-		if fileInfo.exists():
-			logger.debug(f"'{path}' file or directory exists.")
-			return fileInfo
+		# Remove a backup left by an interrupted installation
+		if not self.removeFiles(self.backupFiles): return False
 
-		logger.warning(f"'{path}' file or directory does not exists.")
-		return False
+		backedUpFiles = []
+		movedFiles = []
+		try:
+			for existingFile, backupFile in zip(self.existingFiles, self.backupFiles):
+				if not os.path.lexists(existingFile): continue
+				os.replace(existingFile, backupFile)
+				backedUpFiles.append((backupFile, existingFile))
+
+			for stagedFile, existingFile in zip(self.stagedFiles, self.existingFiles):
+				os.replace(stagedFile, existingFile)
+				movedFiles.append((existingFile, stagedFile))
+		except OSError as error:
+			logger.critical(f"FAILED : Move the staged installation in place: {error}")
+			self.restoreExistingVersion(movedFiles + backedUpFiles)
+			return False
+
+		logger.info("PASSED : Move the staged installation in place.")
 
+		# The new version is already in place, a backup that can not be removed is cleared next time
+		if not self.removeFiles(self.backupFiles):
+			logger.warning(f"Backup of the previous installation could not be removed: {self.backupFiles}")
+
+		return True
 
-	def installDependencies(self, dependencies) -> bool:
-		"""Install required dependecies by calling the mayapy pip package manager.
 
-		TODO add support for multipile dependencies? for loop if it is a list
+	def restoreExistingVersion(self, backedUpFiles) -> bool:
+		"""Renames the files of the existing installation back in place.
+
+		Staged files already moved in place are renamed back to the staging paths first, so they are
+		cleaned up together with the rest of the staged installation.
 
 		Args:
-			dependencies (str or list): Name od the package to install.
+			backedUpFiles (list): Pairs of current and original paths, in the order they are renamed back.
 
 		Returns:
 			bool: True if the operation was successful, False if an	error occured during the operation.
 
 		"""
-		command = f"{self.mayaPy} -m pip install --target={self.moduleScriptPath}/{self.mayaVersion} {dependencies}"
+		try:
+			for currentFile, originalFile in backedUpFiles:
+				os.replace(currentFile, originalFile)
+		except OSError as error:
+			logger.critical(f"FAILED : Restore the existing installation from {self.backupFiles}: {error}")
+			return False
+
+		logger.info("PASSED : Restore the existing installation.")
+		return True
 
-		if self.platformName == "Darwin" or self.platformName == "Linux":
-			command = f"sudo ./{command}"
+
+	def isDependencyInstalled(self, dependency) -> bool:
+		"""Checks if the dependency is already available to the running Maya python.
+
+		The check reads the installed package metadata in-process, so no mayapy subprocess has to be
+		started just to find out that there is nothing to install.
+
+		Args:
+			dependency (str): Name of the package to be queried.
+
+		Returns:
+			bool: True if the package is installed, False otherwise.
+
+		"""
+		# Packages installed by the existing version of the module are removed together with it
+		installedModulePath = os.path.normcase(os.path.abspath(self.moduleDestinationPath))
+		searchPaths = []
+		for path in sys.path:
+			normalizedPath = os.path.normcase(os.path.abspath(path))
+			# Compared with a trailing separator so sibling folders like videoReferenceTools are kept
+			if normalizedPath == installedModulePath or normalizedPath.startswith(installedModulePath + os.sep):
+				continue
+			searchPaths.append(path)
+
+		return next(importlib.metadata.distributions(name=dependency, path=searchPaths), None) is not None
+
+
+	def startDependenciesInstall(self, dependencies) -> "sp.Popen" or bool:
+		"""Starts the mayapy pip package manager for the missing dependencies without waiting for it.
+
+		All the missing dependencies are passed to a single pip call, so pip and its resolver only
+		start once.
+
+		Args:
+			dependencies (str or list): Name or list of names of the packages to install.
+
+		Returns:
+			process (sp.Popen): The running pip process, with its output piped to process.stdout. True
+				is returned instead if all dependencies are already installed and False if pip could
+				not be started.
+
+		"""
+		if isinstance(dependencies, str): dependencies = [dependencies]
+
+		missingDependencies = [
+			dependency for dependency in dependencies if not self.isDependencyInstalled(dependency)
+		]
+		if len(missingDependencies) == 0:
+			logger.info(f"PASSED : Dependencies {dependencies} are already installed.")
+			return True
+
+		# Persistent wheel cache so repeated installs do not download the wheels again
+		self.createDirectory(self.pipCachePath)
+
+		command = [
+			self.mayaPy, "-m", "pip", "install",
+			*self.pipFlags,
+			f"--cache-dir={self.pipCachePath}",
+			f"--target={self.dependenciesPath}",
+			*missingDependencies
+		]
 
 		try:
-			output = sp.check_output(command, shell=True, stderr=sp.STDOUT, universal_newlines=True)
-			logger.info(f"Pip install output:\n{output}")
-		except sp.CalledProcessError:
+			return sp.Popen(command, stdout=sp.PIPE, stderr=sp.STDOUT, text=True, bufsize=1)
+		except OSError:
+			logger.critical(f"FAILED : Could not run '{self.mayaPy}'.")
+			return False
+
+
+	def finishDependenciesInstall(self, process, outputLines) -> bool:
+		"""Logs the output of the running pip process and waits for it to finish.
+
+		Args:
+			process (sp.Popen): The pip process returned by startDependenciesInstall.
+			outputLines (iterable): Lines of the pip output, ending when the process closes its output.
+
+		Returns:
+			bool: True if the operation was successful, False if an	error occured during the operation.
+
+		"""
+		# Log the pip output line by line so the download progress is visible while it runs
+		with process:
+			for line in outputLines:
+				logger.info(f"Pip install output: {line.rstrip()}")
+
+		if process.returncode != 0:
 			logger.critical("FAILED : Dependecies could not be installed")
 			return False
 
@@ -211,6 +377,24 @@ class VideoReferenceInstaller():
 		return True
 
 
+	@staticmethod
+	def readProcessOutput(process, outputQueue) -> None:
+		"""Puts each line of the process output in the queue, followed by None once the output closes.
+
+		Only reads the pipe, so it can run in a worker thread while the main thread logs the lines.
+
+		Args:
+			process (sp.Popen): Process with its output piped to process.stdout.
+			outputQueue (queue.SimpleQueue): Queue receiving the output lines.
+
+		"""
+		try:
+			for line in process.stdout:
+				outputQueue.put(line)
+		finally:
+			outputQueue.put(None)
+
+
 	def createDirectory(self, path) -> bool:
 		"""Creates the specified directory if it does not already exist.
 
@@ -221,6 +405,8 @@ class VideoReferenceInstaller():
 			bool: True if the operation was successful, False if an	error occured during the operation.
 
 		"""
+		from PySide2 import QtCore as qtc
+
 		directory = qtc.QDir(path)
 		if not directory.exists():
 			directory.mkpath(directory.absolutePath())
@@ -231,103 +417,101 @@ class VideoReferenceInstaller():
 		return True
 
 
-	def getFilesInDirectory(self,
-		path,
-		nameFilters=[],
-		filters=qtc.QDir.Files,
-		includeSubDirectories=qtc.QDirIterator.Subdirectories,
-	) -> List[qtc.QFileInfo] or False:
-		"""Returns a list with files contained in the specified directory.
+	def fastCopy(self, source, destination) -> str:
+		"""Copies the source file to the destination file without passing the data through Python.
 
-		Args: 
-			path (string): Path to the directory.
-			nameFilters (list): A list with name filters e.g. ['ellie*'], ['*.fbx'].
-			filters (QDir.Flag): NoFilter, Files.
-			includeSubDirectories (QDirIterator.IteratorFlag): Whether or not search in
-				sub-directories, Subdirectories - true, NoIteratorFlags - false.
+		On Linux the data is copied inside the kernel with os.copy_file_range, if the file system
+		does not support it the copy falls back to shutil.copyfile, which uses os.sendfile where
+		available and plain reads and writes otherwise.
+
+		Args:
+			source (str): Source file path.
+			destination (str): Destination file path.
 
 		Returns:
-			fileInfoList (List[QFileInfo] or False): List with QFileInfo objects that the directory
-			contains,	if the list is empty or the directory does not exis it will	return False.
+			str: The destination file path, so the method can be used as a shutil copy_function.
 
 		"""
-		fileInfo = qtc.QFileInfo(path)
-		if fileInfo.exists() and fileInfo.isDir():
-			fileInfoList = []
-			dirIter = qtc.QDirIterator(path, nameFilters, filters, includeSubDirectories)
-			while dirIter.hasNext():
-				dirIter.next()
-				fileInfoList.append(dirIter.fileInfo())
-		
-			if len(fileInfoList) != 0:
-				return fileInfoList
-	
-			logger.warning(f"'{path}' contains no files with those {nameFilters} name filters.")
+		if not hasattr(os, "copy_file_range"): return shutil.copyfile(source, destination)
 
-		else:	logger.warning(f"Entry: '{path}' does not exist or is not a directory - nothing to return.")
+		try:
+			with open(source, "rb") as sourceFile, open(destination, "wb") as destinationFile:
+				remaining = os.fstat(sourceFile.fileno()).st_size
+				while remaining > 0:
+					copied = os.copy_file_range(sourceFile.fileno(), destinationFile.fileno(), remaining)
+					# Some file systems return 0 instead of an error when they do not support the call
+					if copied == 0: raise OSError(f"copy_file_range stopped before the end of '{source}'")
+					remaining -= copied
+		except OSError:
+			return shutil.copyfile(source, destination)
+
+		return destination
 
-		return False
 
+	def getArchivedFiles(self, archive) -> dict:
+		"""Maps the files of the module bundle to their paths inside the moduleName folder.
 
-	def copy(self, source, destination, overwrite=True) -> bool:
-		"""Copies the source file / directory to the destination.
+		The bundle can either hold the content of the moduleName folder or the moduleName folder
+		itself, in which case the leading moduleName/ is stripped. Python bytecode caches and entries
+		pointing outside of the folder are left out.
 
 		Args:
-			source (str): Source file or directory path.
-			destination (str): Destination directory path.
-			overwrite (bool): If destination file / directory exists, it will be overwritten.
+			archive (zipfile.ZipFile): Opened module bundle.
 
 		Returns:
-			bool: True if the operation was successful, False if an	error occured during the
-				operation.
+			dict: Archive member names keyed by their path relative to the moduleName folder.
 
 		"""
-		fileInfo = self.validateFileInfo(source)
-		if not fileInfo: return False
-
-		# Input can be a directory or a file
-		finished = False
-		if fileInfo.isDir():
-			fileObjs = self.getFilesInDirectory(source)
-			if len(fileObjs) != 0:
-				for fileObj in fileObjs:
-					destinationFilePath = fileObj.filePath().replace(source, destination)
-					destinationFile = qtc.QFile(destinationFilePath)
-					if overwrite and destinationFile.exists(): destinationFile.remove()
-
-					destinationDir = qtc.QFileInfo(destinationFilePath).dir()
-					self.createDirectory(destinationDir)
-					finished = qtc.QFile(fileObj.filePath()).copy(destinationFilePath)
-			else:
-				logger.debug('Did not find any files to copy in the given directory')
+		names = [name for name in archive.namelist() if not name.endswith("/")]
 
-		if fileInfo.isFile():
-			self.createDirectory(destination)
-			destinationFilePath = f'{destination}/{fileInfo.fileName()}'
-			destinationFile = qtc.QFile(destinationFilePath)
-			if overwrite and destinationFile.exists(): destinationFile.remove()
-	
-			finished = qtc.QFile(fileInfo.filePath()).copy(destinationFilePath)
+		rootPrefix = f"{self.moduleName}/"
+		if names and all(name.startswith(rootPrefix) for name in names):
+			prefixLength = len(rootPrefix)
+		else:
+			prefixLength = 0
 
-		if finished: return True
+		archivedFiles = {}
+		for name in names:
+			relativePath = name[prefixLength:]
+			parts = relativePath.split("/")
+			if "__pycache__" in parts or relativePath.endswith(".pyc"): continue
+			if ".." in parts or os.path.isabs(relativePath):
+				logger.warning(f"Skipping '{name}' pointing outside of the module bundle.")
+				continue
+			archivedFiles[relativePath] = name
 
-		return False
+		return archivedFiles
 
 
 	def copyInstallationFiles(self):
 		"""Copies the installation files to the destination.
 
-		Performs the actual installation by first copying the .mod file and then the moduleName folder
-		with all its content.
+		Stages the installation next to the existing one by first copying the .mod file and then the
+		moduleName folder with all its content in a single tree walk, replaceExistingVersion() then
+		moves them in place. Python bytecode caches left in the source folder are not copied.
+
+		If the module is shipped as a moduleName.zip bundle, it is extracted in a single sequential
+		read of the archive instead, with the same files left out.
 
 		"""
-		self.copy(
-			source=self.installationFiles[-1],
-			destination=self.defaultModulesPath
-		)
-		self.copy(
-			source=f"{self.draggedFromPath}/{self.moduleName}",
-			destination=f"{self.defaultModulesPath}/{self.moduleName}"
+		self.createDirectory(self.defaultModulesPath)
+		self.fastCopy(self.installationFiles[-1], self.stagedFiles[1])
+
+		if zipfile.is_zipfile(self.moduleArchivePath):
+			with zipfile.ZipFile(self.moduleArchivePath) as archive:
+				for relativePath, name in self.getArchivedFiles(archive).items():
+					destinationFilePath = f"{self.moduleStagingPath}/{relativePath}"
+					os.makedirs(os.path.dirname(destinationFilePath), exist_ok=True)
+					with archive.open(name) as sourceFile, open(destinationFilePath, "wb") as destinationFile:
+						shutil.copyfileobj(sourceFile, destinationFile)
+			return
+
+		shutil.copytree(
+			self.moduleSourcePath,
+			self.moduleStagingPath,
+			ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+			copy_function=self.fastCopy,
+			dirs_exist_ok=True
 		)
 
 
@@ -337,7 +521,8 @@ class VideoReferenceInstaller():
 		"""
 		# In case this is a plugin module check if the plugin is already loaded and try to unload it
 		if self.isPluginLoaded(self.moduleName):
-			if self.isSceneModified():
+			sceneModified = self.isSceneModified()
+			if sceneModified:
 				# Create a new scene in order to be able to unload the plugin if it is being used
 				input = self.createDialog(
 					message=(
@@ -352,7 +537,8 @@ class VideoReferenceInstaller():
 				if input == "Save": cmds.SaveScene()
 
 			# If plugin was successfully unloaded or was not loaded at all, installation can continue
-			self.unloadPlugin(self.moduleName)
+			# A new scene is only opened when the current one was modified
+			self.unloadPlugin(self.moduleName, force=sceneModified)
 			if not self.isPluginLoaded(self.moduleName):
 				logger.info("PASSED : Plugin was successfully unloaded and installation can continue.")
 			# If could not unload the plugin call for manual installation by user
@@ -392,15 +578,41 @@ class VideoReferenceInstaller():
 			# Plugin setup
 			self.setupPlugin()
 
-			self.removeExistingVersion()
-
-			self.copyInstallationFiles()
+			# Remove leftovers of an interrupted installation
+			self.removeFiles(self.stagedFiles)
+
+			# The new version is staged next to the existing one, the pip install runs while the
+			# installation files are copied and the existing version is only replaced once both succeed
+			dependenciesInstall = True
+			if self.dependencies:
+				dependenciesInstall = self.startDependenciesInstall(self.dependencies)
+
+			with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+				# Only the pipe is read in the worker, the pip output is logged from the main thread
+				if isinstance(dependenciesInstall, sp.Popen):
+					pipOutput = queue.SimpleQueue()
+					executor.submit(self.readProcessOutput, dependenciesInstall, pipOutput)
+
+				try:
+					self.copyInstallationFiles()
+					filesCopied = True
+				except (OSError, zipfile.BadZipFile) as error:
+					logger.critical(f"FAILED : Copy installation files: {error}")
+					filesCopied = False
+
+				# Wait for pip in any case, so it is not writing in the staged installation when it is removed
+				if isinstance(dependenciesInstall, sp.Popen):
+					dependenciesInstall = self.finishDependenciesInstall(
+						dependenciesInstall, iter(pipOutput.get, None)
+					)
+
+			if not filesCopied or not dependenciesInstall:
+				self.removeFiles(self.stagedFiles)
+				return False
 
-			# install dependencies if there are any
-			if self.dependencies:	
-				if not self.installDependencies(self.dependencies):
-					self.removeExistingVersion()
-					return False
+			if not self.replaceExistingVersion():
+				self.removeFiles(self.stagedFiles)
+				return False
 
 			# self.postInstallation()
 
@@ -438,12 +650,14 @@ class VideoReferenceInstaller():
 				operation.
 
 		"""
+		from maya.app.startup import basic
+
 		self.removeModuleEntriesFromSys(self.moduleName)
 
 		sys.path.append(self.moduleScriptPath)
 
-		cmds.loadModule(scan=True)
-		cmds.loadModule(allModules=True)
+		# Load only the freshly installed module instead of rescanning all the module directories
+		cmds.loadModule(load=f"{self.moduleDestinationPath}.mod")
 
 		basic.executeUserSetup()
 
@@ -459,17 +673,18 @@ class VideoReferenceInstaller():
 				operation.
 
 		"""
-		for path in sys.path:
-			if moduleName in path:
-				sys.path.remove(path)
-				logger.debug(f"'{moduleName}' was found and removed from sys.path entries.")
-				break
-
-		for module in sys.modules:
-			if moduleName in module:
-				sys.modules.pop(moduleName)
-				logger.debug(f"'{moduleName}' was found and removed from sys.modules entries.")
-				break
+		sysPathCount = len(sys.path)
+		sys.path[:] = [path for path in sys.path if moduleName not in path]
+		if len(sys.path) != sysPathCount:
+			logger.debug(f"'{moduleName}' was found and removed from sys.path entries.")
+
+		modules = [module for module in sys.modules if moduleName in module]
+		for module in modules:
+			sys.modules.pop(module, None)
+		if modules:
+			logger.debug(f"'{moduleName}' was found and removed from sys.modules entries.")
+
+		return True
 
 
 	def createDialog(self,